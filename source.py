@@ -1,22 +1,57 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
+from tkinter import ttk, messagebox, simpledialog, font as tkfont
 import json
 import os
+import atexit
+from array import array
 import hashlib
-from datetime import datetime # datetime and time are no longer needed as scheduling is removed
+import hmac
+import secrets
+import time
+import concurrent.futures
 
 class VotingSystem:
+    # Height in pixels of one row in the voter's candidate list.
+    ROW_H = 36
+    # Delay in milliseconds used to coalesce bursts of changes into one save.
+    SAVE_DELAY_MS = 500
+    # Seconds after a successful password check during which re-authentication is skipped.
+    AUTH_TTL = 120
+    # Seconds for which the result of checking a particular password is reused.
+    VERIFY_CACHE_TTL = 60
+    # Starting scrypt cost parameters; calibrate_kdf raises them to suit the machine
+    # and admin_password.json may raise them further over time.
+    KDF_DEFAULTS = {'n': 2 ** 14, 'r': 8, 'p': 1}
+    # Calibration aims for one hash to take at least this many nanoseconds...
+    KDF_TARGET_NS = 250_000_000
+    # ...without using more than this much memory or parallelism.
+    KDF_MAX_MEMORY = 36 * 1024 * 1024
+    KDF_MAX_P = 16
+    # Timestamp format for entries in the event log.
+    LOG_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
     def __init__(self):
         """Initialize the voting system application."""
         self.voting_open = False
-        self.votes = {}
         # Start with a default list, expandable up to 32.
         self.candidates = [f"Candidate {i+1}" for i in range(10)]
-        self.total_votes = 0
+        # Vote counts are kept in a 64-bit integer array parallel to self.candidates.
+        self.reset_votes_logic()
         self.data_file = "voting_data.json"
         self.password_file = "admin_password.json"
         self.log_file = "voting_log.txt"
         self.admin_password_hash = None
+        self.kdf_params = dict(self.KDF_DEFAULTS)
+        self._auth_until = 0.0
+        # Maps an HMAC of a checked password (never the password itself) to (time, result).
+        self._verify_cache = {}
+        self._verify_cache_key = secrets.token_bytes(32)
+        self._dirty = False
+        self._save_after_id = None
+        self._status_dirty = False
+        # Slow password hashing runs here so the Tk event loop stays responsive.
+        self._hash_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._rehash_pending = False
         # Removed attributes related to scheduling:
         # self.start_time_str = None
         # self.end_time_str = None
@@ -25,6 +60,23 @@ class VotingSystem:
         # Create main Tkinter root but keep it hidden.
         self.root = tk.Tk()
         self.root.withdraw()
+        self._fonts = {}
+        self.configure_styles()
+
+        # Label texts are bound to variables so unchanged values cause no redraw.
+        self.status_var = tk.StringVar()
+        self.toggle_text_var = tk.StringVar()
+        self.total_var = tk.StringVar()
+        self.results_total_var = tk.StringVar()
+
+        # Keep the log open for the whole session instead of reopening it per event.
+        try:
+            self._log_fp = open(self.log_file, "a", buffering=1)
+        except IOError as e:
+            self._log_fp = None
+            print(f"Error: Could not open log file: {e}")
+        else:
+            atexit.register(self._log_fp.close)
 
         # Initialize the system by setting up password and loading data.
         self.setup_password()
@@ -33,42 +85,112 @@ class VotingSystem:
         # Windows will be managed as Toplevels.
         self.admin_window = None
         self.voter_window = None
+        self._change_pw_win = None
 
         # Create the primary voter interface.
         self.create_voter_window()
         # Removed call to check_scheduled_times()
         # self.check_scheduled_times() # Start checking scheduled times
 
+    def font(self, size, weight='normal'):
+        """Returns a shared named Arial font, creating it the first time it is needed."""
+        key = (size, weight)
+        if key not in self._fonts:
+            self._fonts[key] = tkfont.Font(root=self.root, family='Arial', size=size, weight=weight)
+        return self._fonts[key]
+
+    def configure_styles(self):
+        """Registers the ttk styles used by the voter and admin windows."""
+        style = ttk.Style(self.root)
+        style.configure('Candidates.Treeview', font=self.font(12), rowheight=self.ROW_H)
+        style.configure('Candidates.Treeview.Heading', font=self.font(12, 'bold'))
+        style.configure('Results.Treeview', font=self.font(11), rowheight=28)
+        style.configure('Results.Treeview.Heading', font=self.font(10, 'bold'))
+
     def log_event(self, event_message):
         """Logs an event with a timestamp to the log file."""
+        if self._log_fp is None:
+            return
         try:
-            with open(self.log_file, "a") as log_file:
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                log_file.write(f"[{timestamp}] {event_message}\n")
-        except IOError as e:
+            # The file is line-buffered, so each event is flushed as soon as it is written.
+            self._log_fp.write(f"[{time.strftime(self.LOG_TIME_FORMAT)}] {event_message}\n")
+        except (IOError, ValueError) as e:
             # Silently fail or print to console to avoid bothering the user
             print(f"Error: Could not write to log file: {e}")
 
     def hash_password(self, password):
-        """Hashes a password for secure storage using SHA-256."""
-        return hashlib.sha256(password.encode()).hexdigest()
+        """
+        Hashes a password for secure storage using scrypt with a random salt.
+        The result encodes the cost parameters and salt: scrypt$n$r$p$salt$key.
+        """
+        n, r, p = self.kdf_params['n'], self.kdf_params['r'], self.kdf_params['p']
+        salt = os.urandom(16)
+        key = self._scrypt(password, salt, n, r, p)
+        return f"scrypt${n}${r}${p}${salt.hex()}${key.hex()}"
+
+    def _scrypt(self, password, salt, n, r, p):
+        """Derives a 32-byte key from a password with the given scrypt parameters."""
+        return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p, maxmem=256 * n * r, dklen=32)
+
+    def _is_legacy_hash(self, password_hash):
+        """Returns True for the unsalted SHA-256 hex digests stored by older versions."""
+        return len(password_hash) == 64 and all(c in '0123456789abcdef' for c in password_hash)
 
     def setup_password(self):
         """
         Sets up the initial administrator password if it doesn't exist,
         or loads it from the password file.
         """
+        tuned = False
         if os.path.exists(self.password_file):
             try:
                 with open(self.password_file, 'r') as f:
                     data = json.load(f)
                     self.admin_password_hash = data.get('password_hash')
-                if not self.admin_password_hash:
-                    self.create_initial_password()
+                    # A missing or unusable kdf block is replaced by freshly calibrated parameters.
+                    tuned = self._valid_kdf_params(data.get('kdf'))
+                    if tuned:
+                        self.kdf_params = dict(data['kdf'])
             except (json.JSONDecodeError, IOError):
-                self.create_initial_password()
-        else:
+                self.admin_password_hash = None
+
+        if not tuned:
+            self.calibrate_kdf()
+        if not self.admin_password_hash:
             self.create_initial_password()
+        elif not tuned:
+            # Persist the tuned parameters; the hash itself is upgraded on the next login.
+            self.save_password()
+
+    def _valid_kdf_params(self, params):
+        """Returns True if params holds exactly n, r and p with values scrypt accepts."""
+        if not isinstance(params, dict) or set(params) != {'n', 'r', 'p'}:
+            return False
+        n, r, p = params['n'], params['r'], params['p']
+        if not all(type(v) is int and v > 0 for v in (n, r, p)):
+            return False
+        # n must be a power of two, and the maxmem passed by _scrypt has to fit in a C int.
+        return n > 1 and n & (n - 1) == 0 and 256 * n * r < 2 ** 31 and p * r < 2 ** 30
+
+    def calibrate_kdf(self):
+        """
+        Picks scrypt parameters that make one hash take about KDF_TARGET_NS on this
+        machine, growing memory use first (up to KDF_MAX_MEMORY) and then parallelism.
+        """
+        params = dict(self.KDF_DEFAULTS)
+        while True:
+            start = time.perf_counter_ns()
+            self._scrypt("calibration probe", os.urandom(16), **params)
+            if time.perf_counter_ns() - start >= self.KDF_TARGET_NS:
+                break
+            if 128 * params['r'] * params['n'] * 2 <= self.KDF_MAX_MEMORY:
+                params['n'] *= 2
+            elif params['p'] * 2 <= self.KDF_MAX_P:
+                params['p'] *= 2
+            else:
+                break
+        self.kdf_params = params
+        self.log_event(f"Calibrated scrypt parameters: n={params['n']}, r={params['r']}, p={params['p']}")
 
     def create_initial_password(self):
         """Prompts for and creates the initial administrator password."""
@@ -91,14 +213,94 @@ class VotingSystem:
     def save_password(self):
         """Saves the current admin password hash to its file."""
         try:
-            with open(self.password_file, 'w') as f:
-                json.dump({'password_hash': self.admin_password_hash}, f)
+            self._write_password_file(self.admin_password_hash)
         except IOError as e:
             messagebox.showerror("File Error", f"Could not save password: {str(e)}")
 
+    def _write_password_file(self, password_hash):
+        """Atomically writes a password hash and the scrypt parameters to the password file."""
+        tmp_file = self.password_file + ".tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump({'password_hash': password_hash, 'kdf': self.kdf_params}, f)
+            # An empty password file after a power loss would let anyone set a new password.
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.password_file)
+        self._sync_directory(self.password_file)
+
+    def _hash_and_save(self, password):
+        """Hashes a new password and writes it to the password file; runs on the worker thread."""
+        password_hash = self.hash_password(password)
+        self._write_password_file(password_hash)
+        return password_hash
+
     def verify_password(self, password):
-        """Verifies a given password against the stored hash."""
-        return self.hash_password(password) == self.admin_password_hash
+        """Verifies a given password, reusing the result of a recent check of the same password."""
+        now = time.monotonic()
+        self._verify_cache = {k: v for k, v in self._verify_cache.items() if now - v[0] < self.VERIFY_CACHE_TTL}
+        key = hmac.new(self._verify_cache_key, password.encode(), 'sha256').digest()
+        if key in self._verify_cache:
+            result = self._verify_cache[key][1]
+        else:
+            result = self._check_password(password)
+            self._verify_cache[key] = (now, result)
+        if result:
+            self._auth_until = now + self.AUTH_TTL
+        return result
+
+    def _check_password(self, password):
+        """Checks a given password against the stored hash."""
+        stored = self.admin_password_hash
+        if not stored:
+            # Nothing to compare against; skip the key derivation entirely.
+            return False
+        try:
+            if self._is_legacy_hash(stored):
+                computed, expected, params = hashlib.sha256(password.encode()).hexdigest(), stored, None
+            else:
+                _, n, r, p, salt, expected = stored.split('$')
+                params = {'n': int(n), 'r': int(r), 'p': int(p)}
+                computed = self._scrypt(password, bytes.fromhex(salt), **params).hex()
+        except ValueError:
+            return False
+
+        # compare_digest takes the same time wherever the hashes differ. Comparing
+        # bytes keeps a corrupted, non-ASCII stored hash from raising TypeError.
+        if not hmac.compare_digest(computed.encode(), expected.encode()):
+            return False
+        if params != self.kdf_params:
+            # Re-hash legacy SHA-256 hashes, and hashes made before the cost
+            # parameters were changed, now that the plaintext password is known.
+            self._rehash_in_background(password, stored)
+        return True
+
+    def _rehash_in_background(self, password, stored):
+        """Re-hashes and saves the password on the worker thread, keeping login responsive."""
+        if self._rehash_pending:
+            return
+        self._rehash_pending = True
+        future = self._hash_pool.submit(self._hash_and_save, password)
+
+        def finish():
+            if not future.done():
+                self.root.after(30, finish)
+                return
+            self._rehash_pending = False
+            try:
+                password_hash = future.result()
+            except Exception as e:
+                self.log_event(f"Could not re-hash administrator password: {e}")
+                return
+            # A password change queued behind the re-hash has already replaced the hash.
+            if self.admin_password_hash == stored:
+                self.admin_password_hash = password_hash
+                self.log_event("Administrator password re-hashed with current scrypt parameters")
+
+        self.root.after(30, finish)
+
+    def is_recently_authenticated(self):
+        """Returns True if the password was verified within the last AUTH_TTL seconds."""
+        return time.monotonic() < self._auth_until
 
     def load_data(self):
         """Loads voting data (candidates, votes) from the data file."""
@@ -107,42 +309,88 @@ class VotingSystem:
                 with open(self.data_file, 'r') as f:
                     data = json.load(f)
                     self.candidates = data.get('candidates', self.candidates)
-                    self.votes = data.get('votes', {})
+                    votes = data.get('votes', {})
                     self.total_votes = data.get('total_votes', 0)
                     self.voting_open = data.get('voting_open', False)
                     # Removed loading of start and end times
                     # self.start_time_str = data.get('start_time')
                     # self.end_time_str = data.get('end_time')
-                    # Ensure votes dictionary is complete for all candidates
-                    for candidate in self.candidates:
-                        self.votes.setdefault(candidate, 0)
+                    # Candidates missing from the votes dictionary start at zero
+                    self.vote_counts = array('q', (votes.get(candidate, 0) for candidate in self.candidates))
+                    self._idx = {candidate: i for i, candidate in enumerate(self.candidates)}
             except (json.JSONDecodeError, IOError) as e:
                 messagebox.showwarning("Data Load Error", f"Could not load data: {e}. Starting with fresh data.")
                 self.reset_votes_logic() # Use fresh data
 
     def save_data(self):
-        """Saves the current voting data to the data file."""
+        """Saves the current voting data to the data file atomically."""
         data_to_save = {
             'candidates': self.candidates,
-            'votes': self.votes,
+            # The name-to-count mapping only exists in the saved file.
+            'votes': dict(zip(self.candidates, self.vote_counts)),
             'total_votes': self.total_votes,
             'voting_open': self.voting_open,
             # Removed saving of start and end times
             # 'start_time': self.start_time_str,
             # 'end_time': self.end_time_str,
         }
+        # Set VOTING_DATA_PRETTY to get an indented, human-readable file for debugging.
+        if os.environ.get('VOTING_DATA_PRETTY'):
+            buf = json.dumps(data_to_save, indent=4).encode()
+        else:
+            buf = json.dumps(data_to_save, separators=(',', ':')).encode()
+        tmp_file = self.data_file + ".tmp"
         try:
-            with open(self.data_file, 'w') as f:
-                json.dump(data_to_save, f, indent=4)
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+            try:
+                view = memoryview(buf)
+                while view:
+                    view = view[os.write(fd, view):]
+                # Without this the rename can reach the disk before the data does.
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            # Replacing the file in one step means a crash never leaves it half-written.
+            os.replace(tmp_file, self.data_file)
+            self._sync_directory(self.data_file)
+            self._dirty = False
         except IOError as e:
             messagebox.showerror("File Error", f"Could not save data: {str(e)}")
 
+    def _sync_directory(self, path):
+        """Flushes a rename in the directory holding path to disk (POSIX only)."""
+        if os.name != 'posix':
+            return
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _mark_dirty(self):
+        """Flags the voting data as changed and schedules a single deferred save."""
+        self._dirty = True
+        if self._save_after_id is None:
+            self._save_after_id = self.root.after(self.SAVE_DELAY_MS, self._flush_if_dirty)
+
+    def _flush_if_dirty(self):
+        """Saves the voting data now if it changed since the last save."""
+        if self._save_after_id is not None:
+            # Drop the deferred save when flushing early so it does not fire later for nothing.
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        if self._dirty:
+            self.save_data()
+
     def on_main_window_close(self):
         """Handles the closing of the main application window."""
         # Removed cancellation of schedule_after_id
         # if self.schedule_after_id:
         #     self.root.after_cancel(self.schedule_after_id)
-        self.save_data()
+        self._flush_if_dirty()
+        self._hash_pool.shutdown(wait=False)
+        if self._log_fp is not None:
+            self._log_fp.close()
         self.root.quit()
         self.root.destroy()
 
@@ -162,20 +410,20 @@ class VotingSystem:
         # Header
         header_frame = tk.Frame(self.voter_window, bg='#2c3e50')
         header_frame.grid(row=0, column=0, sticky='ew', padx=10, pady=(10, 5))
-        tk.Label(header_frame, text="VOTING SYSTEM", font=('Arial', 28, 'bold'), fg='white', bg='#2c3e50').pack(pady=20)
+        tk.Label(header_frame, text="VOTING SYSTEM", font=self.font(28, 'bold'), fg='white', bg='#2c3e50').pack(pady=20)
 
         # Control Frame (Status and Admin Login)
         control_frame = tk.Frame(self.voter_window, bg='#f0f8ff')
         control_frame.grid(row=1, column=0, sticky='ew', padx=20, pady=5)
         control_frame.grid_columnconfigure(0, weight=1)
 
-        self.voter_status_label = tk.Label(control_frame, font=('Arial', 16, 'bold'), bg='#f0f8ff')
+        self.voter_status_label = tk.Label(control_frame, textvariable=self.status_var, font=self.font(16, 'bold'), bg='#f0f8ff')
         self.voter_status_label.grid(row=0, column=0, pady=10, sticky='w')
 
-        tk.Button(control_frame, text="Admin Login", command=self.admin_login, font=('Arial', 14, 'bold'), bg='#34495e', fg='white', activebackground='#2c3e50', relief='raised', bd=3).grid(row=0, column=1, pady=10, sticky='e')
+        tk.Button(control_frame, text="Admin Login", command=self.admin_login, font=self.font(14, 'bold'), bg='#34495e', fg='white', activebackground='#2c3e50', relief='raised', bd=3).grid(row=0, column=1, pady=10, sticky='e')
 
         # Instructions
-        tk.Label(self.voter_window, text="Select one candidate and click 'Cast Vote'", font=('Arial', 14), bg='#f0f8ff', fg='#2c3e50').grid(row=2, column=0, pady=(10, 5), sticky='w', padx=20)
+        tk.Label(self.voter_window, text="Select one candidate and click 'Cast Vote'", font=self.font(14), bg='#f0f8ff', fg='#2c3e50').grid(row=2, column=0, pady=(10, 5), sticky='w', padx=20)
 
         # Candidates Area
         candidates_main_frame = tk.Frame(self.voter_window, bg='#ffffff', bd=2, relief='sunken')
@@ -185,48 +433,30 @@ class VotingSystem:
         self.setup_candidates_area(candidates_main_frame)
 
         # Vote Button
-        tk.Button(self.voter_window, text="CAST VOTE", command=self.cast_vote, font=('Arial', 16, 'bold'), bg='#27ae60', fg='white', activebackground='#2ecc71', height=2, relief='raised', bd=3).grid(row=4, column=0, pady=20)
+        tk.Button(self.voter_window, text="CAST VOTE", command=self.cast_vote, font=self.font(16, 'bold'), bg='#27ae60', fg='white', activebackground='#2ecc71', height=2, relief='raised', bd=3).grid(row=4, column=0, pady=20)
 
         self.update_voter_status()
         self.voter_window.deiconify()
 
     def setup_candidates_area(self, parent):
-        """Sets up the scrollable area for displaying candidates."""
-        canvas = tk.Canvas(parent, bg='white', highlightthickness=0)
-        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
-        self.scrollable_candidates_frame = tk.Frame(canvas, bg='white')
-
-        self.scrollable_candidates_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-        canvas.create_window((0, 0), window=self.scrollable_candidates_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        canvas.grid(row=0, column=0, sticky='nsew')
+        """Sets up the scrollable list for displaying and selecting candidates."""
+        self.cand_tv = ttk.Treeview(parent, columns=('name',), show='tree headings', selectmode='browse', style='Candidates.Treeview')
+        self.cand_tv.heading('#0', text="No.")
+        self.cand_tv.column('#0', width=70, stretch=False)
+        self.cand_tv.heading('name', text="Candidate", anchor='w')
+        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self.cand_tv.yview)
+        self.cand_tv.configure(yscrollcommand=scrollbar.set)
+
+        self.cand_tv.grid(row=0, column=0, sticky='nsew')
         scrollbar.grid(row=0, column=1, sticky='ns')
 
-        # Bind mouse wheel scrolling for convenience
-        canvas.bind_all("<MouseWheel>", lambda event: canvas.yview_scroll(int(-1 * (event.delta / 120)), "units"))
-        
-        self.selected_candidate = tk.StringVar()
         self.update_candidate_display()
 
     def update_candidate_display(self):
-        """Updates the radio buttons in the voter and admin interfaces."""
-        for widget in self.scrollable_candidates_frame.winfo_children():
-            widget.destroy()
-
-        self.scrollable_candidates_frame.grid_columnconfigure(0, weight=1)
+        """Updates the candidate list in the voter interface."""
+        self.cand_tv.delete(*self.cand_tv.get_children())
         for i, candidate in enumerate(self.candidates):
-            rb = tk.Radiobutton(
-                self.scrollable_candidates_frame,
-                text=f"{i+1:2d}. {candidate}",
-                variable=self.selected_candidate,
-                value=candidate,
-                font=('Arial', 12),
-                bg='white',
-                activebackground='#e8f4fd',
-                padx=20, pady=8, anchor='w'
-            )
-            rb.grid(row=i, column=0, sticky='ew', padx=10, pady=(2, 3))
+            self.cand_tv.insert('', 'end', iid=candidate, text=f"{i+1:2d}", values=(candidate,))
 
     def admin_login(self):
         """Handles the administrator login attempt."""
@@ -252,7 +482,7 @@ class VotingSystem:
         # Header
         header_frame = tk.Frame(self.admin_window, bg='#34495e')
         header_frame.grid(row=0, column=0, sticky='ew', padx=10, pady=(10, 5))
-        tk.Label(header_frame, text="ADMINISTRATOR PANEL", font=('Arial', 24, 'bold'), fg='white', bg='#34495e').pack(pady=20)
+        tk.Label(header_frame, text="ADMINISTRATOR PANEL", font=self.font(24, 'bold'), fg='white', bg='#34495e').pack(pady=20)
 
         # Notebook for tabs
         notebook = ttk.Notebook(self.admin_window)
@@ -268,22 +498,23 @@ class VotingSystem:
         control_frame.grid_columnconfigure(0, weight=1)
         
         # --- Manual Voting Control ---
-        manual_section = tk.LabelFrame(control_frame, text="Voting Control", font=('Arial', 16, 'bold'), fg='#2c3e50', padx=20, pady=20)
+        manual_section = tk.LabelFrame(control_frame, text="Voting Control", font=self.font(16, 'bold'), fg='#2c3e50', padx=20, pady=20)
         manual_section.grid(row=0, column=0, sticky='ew', pady=(10, 20))
         manual_section.grid_columnconfigure(0, weight=1)
 
-        self.master_toggle_btn = tk.Button(manual_section, command=self.toggle_master_voting, font=('Arial', 14, 'bold'), height=2, bd=3, relief='raised')
+        self.master_toggle_btn = tk.Button(manual_section, textvariable=self.toggle_text_var, fg='white', command=self.toggle_master_voting, font=self.font(14, 'bold'), height=2, bd=3, relief='raised')
         self.master_toggle_btn.grid(row=0, column=0, padx=15, pady=10, sticky='ew')
 
         # Removed Scheduled Voting Control section
 
         # --- Live Statistics ---
-        stats_section = tk.LabelFrame(control_frame, text="Live Statistics", font=('Arial', 16, 'bold'), fg='#2c3e50', padx=20, pady=20)
+        stats_section = tk.LabelFrame(control_frame, text="Live Statistics", font=self.font(16, 'bold'), fg='#2c3e50', padx=20, pady=20)
         stats_section.grid(row=1, column=0, sticky='nsew', pady=10) # Changed row from 2 to 1
         stats_section.grid_columnconfigure(0, weight=1)
 
-        self.total_votes_label = tk.Label(stats_section, text=f"Total Votes Cast: {self.total_votes}", font=('Arial', 18, 'bold'), fg='#2c3e50')
+        self.total_votes_label = tk.Label(stats_section, textvariable=self.total_var, font=self.font(18, 'bold'), fg='#2c3e50')
         self.total_votes_label.pack(pady=20)
+        self.update_vote_totals()
 
         self.update_admin_status()
 
@@ -295,24 +526,27 @@ class VotingSystem:
         secure_frame.grid_rowconfigure(1, weight=1)
         
         # Authentication Section
-        auth_section = tk.LabelFrame(secure_frame, text="Secure Access Required", font=('Arial', 16, 'bold'), fg='#c0392b', padx=20, pady=15)
+        auth_section = tk.LabelFrame(secure_frame, text="Secure Access Required", font=self.font(16, 'bold'), fg='#c0392b', padx=20, pady=15)
         auth_section.grid(row=0, column=0, sticky='ew', pady=20)
         auth_section.grid_columnconfigure(0, weight=1)
         
-        auth_button = tk.Button(auth_section, text="AUTHENTICATE FOR SECURE FUNCTIONS", command=lambda: self.authenticate_secure_admin(parent_frame=secure_frame), font=('Arial', 14, 'bold'), bg='#e67e22', fg='white', bd=3, relief='raised')
+        auth_button = tk.Button(auth_section, text="AUTHENTICATE FOR SECURE FUNCTIONS", command=lambda: self.authenticate_secure_admin(parent_frame=secure_frame), font=self.font(14, 'bold'), bg='#e67e22', fg='white', bd=3, relief='raised')
         auth_button.pack(pady=15, fill='x', expand=True)
 
     def authenticate_secure_admin(self, parent_frame):
         """Authenticates user to reveal secure admin functions."""
-        password = simpledialog.askstring("Secure Authentication", "Enter administrator password to access secure functions:", show='*')
-        if password and self.verify_password(password):
-            # Hide the authentication button and show the functions
-            for widget in parent_frame.winfo_children():
-                widget.destroy()
-            self.setup_secure_functions(parent_frame)
-            messagebox.showinfo("Access Granted", "Secure functions are now available.")
-        elif password is not None:
-            messagebox.showerror("Authentication Failed", "Incorrect password.")
+        if not self.is_recently_authenticated():
+            password = simpledialog.askstring("Secure Authentication", "Enter administrator password to access secure functions:", show='*')
+            if not (password and self.verify_password(password)):
+                if password is not None:
+                    messagebox.showerror("Authentication Failed", "Incorrect password.")
+                return
+
+        # Hide the authentication button and show the functions
+        for widget in parent_frame.winfo_children():
+            widget.destroy()
+        self.setup_secure_functions(parent_frame)
+        messagebox.showinfo("Access Granted", "Secure functions are now available.")
 
     def setup_secure_functions(self, parent_frame):
         """Sets up the UI for secure functions after successful authentication."""
@@ -320,36 +554,42 @@ class VotingSystem:
         parent_frame.grid_columnconfigure((0,1), weight=1)
 
         # Detailed Results Section
-        results_section = tk.LabelFrame(parent_frame, text="Detailed Vote Results", font=('Arial', 14, 'bold'), fg='#2c3e50', padx=15, pady=15)
+        results_section = tk.LabelFrame(parent_frame, text="Detailed Vote Results", font=self.font(14, 'bold'), fg='#2c3e50', padx=15, pady=15)
         results_section.grid(row=0, column=0, columnspan=2, sticky='nsew', padx=5, pady=5)
-        results_section.grid_rowconfigure(0, weight=1)
+        results_section.grid_rowconfigure(1, weight=1)
         results_section.grid_columnconfigure(0, weight=1)
 
-        # Results display with scrollbar
-        res_canvas = tk.Canvas(results_section, bg='white', highlightthickness=1)
-        res_scrollbar = ttk.Scrollbar(results_section, orient="vertical", command=res_canvas.yview)
-        self.results_display_frame = tk.Frame(res_canvas, bg='white')
-        self.results_display_frame.bind("<Configure>", lambda e: res_canvas.configure(scrollregion=res_canvas.bbox("all")))
-        res_canvas.create_window((0, 0), window=self.results_display_frame, anchor="nw")
-        res_canvas.configure(yscrollcommand=res_scrollbar.set)
-        res_canvas.grid(row=0, column=0, sticky='nsew')
-        res_scrollbar.grid(row=0, column=1, sticky='ns')
+        # Overall total
+        self.results_total_label = tk.Label(results_section, textvariable=self.results_total_var, font=self.font(14, 'bold'), bg='#3498db', fg='white')
+        self.results_total_label.grid(row=0, column=0, columnspan=2, sticky='ew', pady=(5, 10), ipady=10)
+
+        # Results table with scrollbar; Treeview only draws the rows in view
+        columns = (('rank', "Rank", 60), ('name', "Candidate Name", 300), ('votes', "Votes", 80), ('pct', "% of Total", 100))
+        self.results_tree = ttk.Treeview(results_section, columns=[c[0] for c in columns], show='headings', height=15, style='Results.Treeview')
+        for column, heading, width in columns:
+            self.results_tree.heading(column, text=heading)
+            self.results_tree.column(column, width=width, anchor='w' if column == 'name' else 'center', stretch=True)
+        self.results_tree.tag_configure('even', background='#ecf0f1')
+        res_scrollbar = ttk.Scrollbar(results_section, orient="vertical", command=self.results_tree.yview)
+        self.results_tree.configure(yscrollcommand=res_scrollbar.set)
+        self.results_tree.grid(row=1, column=0, sticky='nsew')
+        res_scrollbar.grid(row=1, column=1, sticky='ns')
 
         # Data Management Section
-        data_mgmt_section = tk.LabelFrame(parent_frame, text="Data Management", font=('Arial', 14, 'bold'), fg='#2c3e50', padx=15, pady=15)
+        data_mgmt_section = tk.LabelFrame(parent_frame, text="Data Management", font=self.font(14, 'bold'), fg='#2c3e50', padx=15, pady=15)
         data_mgmt_section.grid(row=1, column=0, sticky='nsew', padx=5, pady=10)
         data_mgmt_section.grid_columnconfigure(0, weight=1)
 
-        tk.Button(data_mgmt_section, text="RESET ALL VOTES", command=self.reset_votes, font=('Arial', 12, 'bold'), bg='#c0392b', fg='white', bd=3, relief='raised').pack(pady=5, fill='x')
-        tk.Button(data_mgmt_section, text="Refresh Results", command=self.display_results, font=('Arial', 11)).pack(pady=5, fill='x')
+        tk.Button(data_mgmt_section, text="RESET ALL VOTES", command=self.reset_votes, font=self.font(12, 'bold'), bg='#c0392b', fg='white', bd=3, relief='raised').pack(pady=5, fill='x')
+        tk.Button(data_mgmt_section, text="Refresh Results", command=self.display_results, font=self.font(11)).pack(pady=5, fill='x')
 
         # System Management Section
-        sys_mgmt_section = tk.LabelFrame(parent_frame, text="System Management", font=('Arial', 14, 'bold'), fg='#2c3e50', padx=15, pady=15)
+        sys_mgmt_section = tk.LabelFrame(parent_frame, text="System Management", font=self.font(14, 'bold'), fg='#2c3e50', padx=15, pady=15)
         sys_mgmt_section.grid(row=1, column=1, sticky='nsew', padx=5, pady=10)
         sys_mgmt_section.grid_columnconfigure(0, weight=1)
 
-        tk.Button(sys_mgmt_section, text="MANAGE CANDIDATES", command=self.manage_candidates, font=('Arial', 12, 'bold'), bg='#8e44ad', fg='white', bd=3, relief='raised').pack(pady=5, fill='x')
-        tk.Button(sys_mgmt_section, text="Change Admin Password", command=self.change_password, font=('Arial', 11)).pack(pady=5, fill='x')
+        tk.Button(sys_mgmt_section, text="MANAGE CANDIDATES", command=self.manage_candidates, font=self.font(12, 'bold'), bg='#8e44ad', fg='white', bd=3, relief='raised').pack(pady=5, fill='x')
+        tk.Button(sys_mgmt_section, text="Change Admin Password", command=self.change_password, font=self.font(11)).pack(pady=5, fill='x')
 
         self.display_results()
 
@@ -358,18 +598,20 @@ class VotingSystem:
         if not self.voting_open:
             messagebox.showerror("Voting Closed", "We're sorry, the voting period is currently closed.")
             return
-        selected = self.selected_candidate.get()
+        selection = self.cand_tv.selection()
+        selected = selection[0] if selection else ''
         if not selected:
             messagebox.showwarning("No Selection", "Please select a candidate before casting your vote.")
             return
 
-        self.votes[selected] = self.votes.get(selected, 0) + 1
+        self.vote_counts[self._idx[selected]] += 1
         self.total_votes += 1
         
-        self.save_data()
-        self.update_displays()
+        self._mark_dirty()
+        self._apply_vote_delta(selected)
         
-        self.selected_candidate.set("") # Clear selection after voting
+        self.cand_tv.selection_set(()) # Clear selection after voting
+        self._flush_if_dirty() # The vote must be on disk before it is reported as recorded
         messagebox.showinfo("Vote Recorded", f"Thank you! Your vote for '{selected}' has been successfully recorded.")
 
     def open_voting(self): # Removed from_schedule parameter
@@ -379,7 +621,8 @@ class VotingSystem:
             # Removed conditional logging for scheduled opening
             self.log_event("Voting Opened Manually") 
             self.update_all_statuses()
-            self.save_data()
+            self._mark_dirty()
+            self._flush_if_dirty()
             messagebox.showinfo("Voting Opened", "The voting period is now OPEN.")
 
     def close_voting(self): # Removed from_schedule parameter
@@ -389,7 +632,8 @@ class VotingSystem:
             # Removed conditional logging for scheduled closing
             self.log_event("Voting Closed Manually")
             self.update_all_statuses()
-            self.save_data()
+            self._mark_dirty()
+            self._flush_if_dirty()
             messagebox.showinfo("Voting Closed", "The voting period is now CLOSED.")
 
     def toggle_master_voting(self):
@@ -403,7 +647,7 @@ class VotingSystem:
             self.log_event("Voting Closed Manually (Override)")
             
         self.update_all_statuses()
-        self.save_data()
+        self._mark_dirty()
         # Removed clearing scheduled times as scheduling is removed
         # self.start_time_str = None
         # self.end_time_str = None
@@ -457,77 +701,118 @@ class VotingSystem:
 
 
     def update_all_statuses(self):
-        """Convenience function to update all status labels."""
+        """Schedules a single refresh of all status labels for when Tk is next idle."""
+        if not self._status_dirty:
+            self._status_dirty = True
+            self.root.after_idle(self._do_update_statuses)
+
+    def _do_update_statuses(self):
+        """Refreshes all status labels; a burst of status changes ends up here once."""
+        self._status_dirty = False
         self.update_voter_status()
         if self.admin_window and self.admin_window.winfo_exists():
             self.update_admin_status()
 
+    def _set_var(self, var, value):
+        """Sets a Tk variable only if its value changes; returns True if it did."""
+        if var.get() == value:
+            return False
+        var.set(value)
+        return True
+
     def update_voter_status(self):
         """Updates the status label on the main voter window."""
         if self.voting_open:
-            self.voter_status_label.config(text="Voting is OPEN", fg='#27ae60')
+            text, color = "Voting is OPEN", '#27ae60'
         else:
-            self.voter_status_label.config(text="Voting is CLOSED", fg='#e74c3c')
+            text, color = "Voting is CLOSED", '#e74c3c'
+        self._set_var(self.status_var, text)
+        if self.voter_status_label.cget('fg') != color:
+            self.voter_status_label.config(fg=color)
 
     def update_admin_status(self):
         """Updates the status label on the admin panel."""
         if hasattr(self, 'master_toggle_btn') and self.master_toggle_btn.winfo_exists():
             if self.voting_open:
-                self.master_toggle_btn.config(text="VOTING IS OPEN (Click to Close)", bg='#27ae60', fg='white')
+                text, color = "VOTING IS OPEN (Click to Close)", '#27ae60'
             else:
-                self.master_toggle_btn.config(text="VOTING IS CLOSED (Click to Open)", bg='#e74c3c', fg='white')
+                text, color = "VOTING IS CLOSED (Click to Open)", '#e74c3c'
+            self._set_var(self.toggle_text_var, text)
+            if self.master_toggle_btn.cget('bg') != color:
+                self.master_toggle_btn.config(bg=color)
+
+    def update_vote_totals(self):
+        """Updates the total vote count labels on the admin panel."""
+        self._set_var(self.total_var, f"Total Votes Cast: {self.total_votes}")
+        self._set_var(self.results_total_var, f"OVERALL TOTAL VOTES: {self.total_votes}")
 
     def update_displays(self):
         """Updates vote counts on the admin panel."""
-        if hasattr(self, 'total_votes_label') and self.total_votes_label.winfo_exists():
-            self.total_votes_label.config(text=f"Total Votes Cast: {self.total_votes}")
-        if hasattr(self, 'results_display_frame') and self.results_display_frame.winfo_exists():
+        self.update_vote_totals()
+        if hasattr(self, 'results_tree') and self.results_tree.winfo_exists():
             self.display_results()
 
-    def display_results(self):
-        """Displays detailed voting results in the secure admin tab."""
-        for widget in self.results_display_frame.winfo_children():
-            widget.destroy()
-
-        self.results_display_frame.grid_columnconfigure(1, weight=1)
-
-        # Overall total
-        tk.Label(self.results_display_frame, text=f"OVERALL TOTAL VOTES: {self.total_votes}", font=('Arial', 14, 'bold'), bg='#3498db', fg='white').grid(row=0, column=0, columnspan=4, sticky='ew', pady=(5, 10), ipady=10)
+    def _apply_vote_delta(self, selected):
+        """Updates the admin panel for one new vote without re-sorting all results."""
+        self.update_vote_totals()
+        if not (hasattr(self, 'results_tree') and self.results_tree.winfo_exists()):
+            return
 
-        # Headers
-        headers = ["Rank", "Candidate Name", "Votes", "% of Total"]
-        for i, header in enumerate(headers):
-            tk.Label(self.results_display_frame, text=header, font=('Arial', 10, 'bold'), bg='white').grid(row=1, column=i, sticky='ew', pady=5)
+        tree = self.results_tree
+        if not tree.exists(selected):
+            self.display_results()
+            return
+        children = tree.get_children()
+        idx = new_idx = tree.index(selected)
+        counts, index = self.vote_counts, self._idx
+        def rank_key(candidate):
+            # Ties keep candidate order, matching the stable sort in display_results.
+            i = index[candidate]
+            return counts[i], -i
+        selected_key = rank_key(selected)
+        # Move the candidate up past every row it now out-ranks.
+        while new_idx > 0 and rank_key(children[new_idx - 1]) < selected_key:
+            new_idx -= 1
+        if new_idx != idx:
+            tree.move(selected, '', new_idx)
+        # Every percentage changes with the total, so refresh the values in place.
+        for rank, candidate in enumerate(tree.get_children()):
+            tree.item(candidate, values=self._result_values(rank, index[candidate]), tags=('even',) if rank % 2 == 0 else ())
 
-        sorted_candidates = sorted(self.votes.items(), key=lambda item: item[1], reverse=True)
-        
-        for i, (candidate, vote_count) in enumerate(sorted_candidates):
-            percentage = (vote_count / self.total_votes * 100) if self.total_votes > 0 else 0
-            bg_color = '#ecf0f1' if i % 2 == 0 else '#ffffff'
-            
-            tk.Label(self.results_display_frame, text=f"{i+1}.", font=('Arial', 11), bg=bg_color).grid(row=i+2, column=0, sticky='ew', pady=2)
-            tk.Label(self.results_display_frame, text=candidate, font=('Arial', 11), bg=bg_color, anchor='w', padx=10).grid(row=i+2, column=1, sticky='ew', pady=2)
-            tk.Label(self.results_display_frame, text=f"{vote_count}", font=('Arial', 11, 'bold'), bg=bg_color).grid(row=i+2, column=2, sticky='ew', pady=2)
-            tk.Label(self.results_display_frame, text=f"{percentage:.1f}%", font=('Arial', 11), bg=bg_color).grid(row=i+2, column=3, sticky='ew', pady=2)
+    def display_results(self):
+        """Displays detailed voting results in the secure admin tab."""
+        tree = self.results_tree
+        self.update_vote_totals()
+        tree.delete(*tree.get_children())
+        order = sorted(range(len(self.candidates)), key=self.vote_counts.__getitem__, reverse=True)
+        for rank, i in enumerate(order):
+            tree.insert('', 'end', iid=self.candidates[i], values=self._result_values(rank, i), tags=('even',) if rank % 2 == 0 else ())
+
+    def _result_values(self, rank, i):
+        """Returns the results table cells for candidate `i` at a 0-based rank."""
+        vote_count = self.vote_counts[i]
+        percentage = vote_count * (100.0 / max(self.total_votes, 1))
+        return (f"{rank+1}.", self.candidates[i], vote_count, f"{percentage:.1f}%")
 
     def reset_votes_logic(self):
         """Internal logic to reset votes without GUI interaction."""
-        self.votes.clear()
-        for candidate in self.candidates:
-            self.votes[candidate] = 0
+        self.vote_counts = array('q', bytes(8 * len(self.candidates)))
+        self._idx = {candidate: i for i, candidate in enumerate(self.candidates)}
         self.total_votes = 0
 
     def reset_votes(self):
         """Resets all vote data after re-authentication."""
-        password = simpledialog.askstring("Confirm Vote Reset", "This is a critical action. Enter the administrator password to confirm a full vote reset:", show='*')
-        if not (password and self.verify_password(password)):
-            messagebox.showerror("Authentication Failed", "Incorrect password. Reset operation cancelled.")
-            return
+        if not self.is_recently_authenticated():
+            password = simpledialog.askstring("Confirm Vote Reset", "This is a critical action. Enter the administrator password to confirm a full vote reset:", show='*')
+            if not (password and self.verify_password(password)):
+                messagebox.showerror("Authentication Failed", "Incorrect password. Reset operation cancelled.")
+                return
         
         if messagebox.askyesno("Final Confirmation", "WARNING: This will permanently delete ALL cast votes and reset counts to zero. This action cannot be undone. Are you absolutely sure?"):
             self.reset_votes_logic()
-            self.save_data()
+            self._mark_dirty()
             self.update_displays()
+            self._flush_if_dirty()
             messagebox.showinfo("Reset Complete", "All voting data has been successfully cleared.")
 
     def manage_candidates(self):
@@ -538,34 +823,72 @@ class VotingSystem:
         manage_window.transient(self.admin_window)
         manage_window.grab_set()
 
-        tk.Label(manage_window, text="Manage Candidates (Max 32)", font=('Arial', 18, 'bold')).pack(pady=10)
-        tk.Label(manage_window, text="Edit names, clear a field to remove, or add new names.").pack(pady=5)
-        
-        # Frame for entries with a scrollbar
-        outer_frame = tk.Frame(manage_window)
-        outer_frame.pack(fill='both', expand=True, padx=20, pady=10)
-        canvas = tk.Canvas(outer_frame)
-        scrollbar = ttk.Scrollbar(outer_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        tk.Label(manage_window, text="Manage Candidates (Max 32)", font=self.font(18, 'bold')).pack(pady=10)
+        tk.Label(manage_window, text="Double-click a name to edit it, clear it to remove, or add new names.").pack(pady=5)
         
-        entries = []
+        # Names are rows of a Treeview; a single Entry is placed over a row while it is edited
+        list_frame = tk.Frame(manage_window)
+        list_frame.pack(fill='both', expand=True, padx=20, pady=10)
+        list_frame.grid_rowconfigure(0, weight=1)
+        list_frame.grid_columnconfigure(0, weight=1)
+        tree = ttk.Treeview(list_frame, columns=('name',), show='headings', selectmode='browse', style='Candidates.Treeview')
+        tree.heading('name', text="Candidate Name", anchor='w')
+        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        tree.grid(row=0, column=0, sticky='nsew')
+        scrollbar.grid(row=0, column=1, sticky='ns')
+
         for candidate in self.candidates:
-            entry = tk.Entry(scrollable_frame, font=('Arial', 12), width=50)
-            entry.insert(0, candidate)
-            entry.pack(padx=10, pady=4, fill='x')
-            entries.append(entry)
+            tree.insert('', 'end', values=(candidate,))
+
+        active_edit = []
+
+        def begin_edit(iid):
+            finish_edit()
+            tree.see(iid)
+            tree.update_idletasks()
+            bbox = tree.bbox(iid, 'name')
+            if not bbox:
+                return
+            x, y, width, height = bbox
+            entry = tk.Entry(tree, font=self.font(12))
+            entry.insert(0, tree.set(iid, 'name'))
+            entry.select_range(0, 'end')
+            entry.place(x=x, y=y, width=width, height=height)
+            entry.focus_set()
+
+            def close(commit):
+                if commit:
+                    tree.set(iid, 'name', entry.get())
+                active_edit.clear()
+                entry.unbind("<FocusOut>")
+                entry.destroy()
+
+            active_edit.append(close)
+            entry.bind("<Return>", lambda e: close(True))
+            entry.bind("<FocusOut>", lambda e: close(True))
+            entry.bind("<Escape>", lambda e: close(False))
+
+        def finish_edit():
+            if active_edit:
+                active_edit[0](True)
+
+        def on_double_click(event):
+            iid = tree.identify_row(event.y)
+            if iid:
+                begin_edit(iid)
+
+        tree.bind("<Double-1>", on_double_click)
+        tree.bind("<Return>", lambda e: tree.focus() and begin_edit(tree.focus()))
 
         def add_field():
-            if len(entries) < 32:
-                entry = tk.Entry(scrollable_frame, font=('Arial', 12), width=50)
-                entry.pack(padx=10, pady=4, fill='x')
-                entries.append(entry)
+            if len(tree.get_children()) < 32:
+                begin_edit(tree.insert('', 'end', values=("",)))
 
         def save_candidates():
-            new_candidates = [entry.get().strip() for entry in entries if entry.get().strip()]
+            finish_edit()
+            names = [tree.set(iid, 'name').strip() for iid in tree.get_children()]
+            new_candidates = [name for name in names if name]
             if len(new_candidates) > 32:
                 messagebox.showerror("Limit Exceeded", f"You can have a maximum of 32 candidates. You have entered {len(new_candidates)}.")
                 return
@@ -575,54 +898,108 @@ class VotingSystem:
 
             self.candidates = new_candidates
             self.reset_votes_logic() # Reset votes as candidates changed
-            self.save_data()
+            self._mark_dirty()
             self.update_candidate_display()
             self.update_displays()
+            self._flush_if_dirty()
             messagebox.showinfo("Success", "Candidate list updated. All votes have been reset.", parent=manage_window)
             manage_window.destroy()
 
         button_frame = tk.Frame(manage_window)
         button_frame.pack(pady=10)
         tk.Button(button_frame, text="Add Field", command=add_field).pack(side='left', padx=10)
-        tk.Button(button_frame, text="Save Changes", command=save_candidates, font=('Arial', 12, 'bold')).pack(side='left', padx=10)
+        tk.Button(button_frame, text="Save Changes", command=save_candidates, font=self.font(12, 'bold')).pack(side='left', padx=10)
         tk.Button(button_frame, text="Cancel", command=manage_window.destroy).pack(side='left', padx=10)
         
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
     def change_password(self):
         """Opens a dialog to change the administrator password."""
+        # The dialog is built once and then hidden and shown again on later calls.
+        if self._change_pw_win is not None and self._change_pw_win.winfo_exists():
+            self.wipe_entries(self._pw_entries.values())
+            self._change_pw_win.deiconify()
+            self._change_pw_win.grab_set()
+            return
+
         win = tk.Toplevel(self.admin_window)
+        # Stay hidden while the widgets are laid out so geometry is computed once.
+        win.withdraw()
         win.title("Change Password")
         win.transient(self.admin_window)
-        win.grab_set()
 
-        tk.Label(win, text="Current Password:").grid(row=0, column=0, padx=10, pady=5)
-        current_pass = tk.Entry(win, show='*')
-        current_pass.grid(row=0, column=1, padx=10, pady=5)
+        self._pw_entries = {}
+        for row, text in enumerate(("Current Password:", "New Password:", "Confirm New Password:")):
+            tk.Label(win, text=text).grid(row=row, column=0, padx=10, pady=5)
+            entry = tk.Entry(win, show='*')
+            entry.grid(row=row, column=1, padx=10, pady=5)
+            self._pw_entries[text] = entry
+        current_pass, new_pass, confirm_pass = self._pw_entries.values()
 
-        tk.Label(win, text="New Password:").grid(row=1, column=0, padx=10, pady=5)
-        new_pass = tk.Entry(win, show='*')
-        new_pass.grid(row=1, column=1, padx=10, pady=5)
-        
-        tk.Label(win, text="Confirm New Password:").grid(row=2, column=0, padx=10, pady=5)
-        confirm_pass = tk.Entry(win, show='*')
-        confirm_pass.grid(row=2, column=1, padx=10, pady=5)
+        def hide():
+            self.wipe_entries(self._pw_entries.values())
+            win.grab_release()
+            win.withdraw()
 
         def do_change():
-            if not self.verify_password(current_pass.get()):
-                messagebox.showerror("Error", "Current password is not correct.", parent=win)
-                return
-            if not new_pass.get() or new_pass.get() != confirm_pass.get():
-                messagebox.showerror("Error", "New passwords do not match or are empty.", parent=win)
-                return
-            
-            self.admin_password_hash = self.hash_password(new_pass.get())
-            self.save_password()
-            messagebox.showinfo("Success", "Password changed successfully.", parent=win)
-            win.destroy()
+            # Read each entry once; later checks and the hash all use the same values.
+            cur, new, conf = current_pass.get(), new_pass.get(), confirm_pass.get()
+            try:
+                if not self.verify_password(cur):
+                    messagebox.showerror("Error", "Current password is not correct.", parent=win)
+                    return
+                if not new or not hmac.compare_digest(new.encode('utf-8'), conf.encode('utf-8')):
+                    messagebox.showerror("Error", "New passwords do not match or are empty.", parent=win)
+                    return
+
+                # Hash and save on the worker thread and poll for the result so the dialog keeps redrawing.
+                change_button.config(state='disabled')
+                win.protocol("WM_DELETE_WINDOW", lambda: None)
+                future = self._hash_pool.submit(self._hash_and_save, new)
+
+                def finish():
+                    if not future.done():
+                        self.root.after(30, finish)
+                        return
+                    # Update the stored hash first: the dialog may have been destroyed
+                    # together with the admin panel while the worker was running.
+                    # Catch everything: an error left unreported here would keep the dialog modal and disabled.
+                    try:
+                        self.admin_password_hash = future.result()
+                        error = None
+                    except Exception as e:
+                        error = e
+                    else:
+                        self._verify_cache.clear()
+                    if not win.winfo_exists():
+                        return
+                    change_button.config(state='normal')
+                    win.protocol("WM_DELETE_WINDOW", hide)
+                    if error is not None:
+                        messagebox.showerror("Error", f"Could not save password: {str(error)}", parent=win)
+                        return
+                    messagebox.showinfo("Success", "Password changed successfully.", parent=win)
+                    hide()
+
+                self.root.after(30, finish)
+            finally:
+                # Don't leave plaintext passwords behind in the Entry widgets or in locals.
+                self.wipe_entries(self._pw_entries.values())
+                del cur, new, conf
+
+        change_button = tk.Button(win, text="Change Password", command=do_change)
+        change_button.grid(row=3, column=0, columnspan=2, pady=10)
+        win.protocol("WM_DELETE_WINDOW", hide)
+        self._change_pw_win = win
+
+        win.update_idletasks()
+        win.deiconify()
+        win.grab_set()
 
-        tk.Button(win, text="Change Password", command=do_change).grid(row=3, column=0, columnspan=2, pady=10)
+    def wipe_entries(self, entries):
+        """Overwrites and then clears Entry widgets that held passwords."""
+        for entry in entries:
+            entry.delete(0, 'end')
+            entry.insert(0, 'x' * 64)
+            entry.delete(0, 'end')
 
     def run(self):
         """Starts the Tkinter main event loop."""